@@ -15,6 +15,7 @@ if __name__ == '__main__':
     logger = logging.getLogger('eink_calendar')
     logger.info('Starting!')
 
+    clock.load_sprites('calendar_sprites.pkl')
     if 'epd12in48b' in sys.modules:
         eink = clock.EPD_Clock(config, portrait=True, clear=True)
     else:
@@ -23,3 +24,4 @@ if __name__ == '__main__':
         eink = clock.PIL_Clock(config, portrait=True)
     eink.draw_calendar()
     eink.display()
+    clock.save_sprites('calendar_sprites.pkl')
@@ -3,13 +3,20 @@
 # SPDX-License-Identifier: FAFOL
 
 import calendar
+import functools
+import hashlib
 import logging
 import logging.config
+import os
 import pickle
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import arrow
+import PIL
+from arrow.formatter import DateTimeFormatter
 from PIL import Image, ImageDraw, ImageFont
 
 try:
@@ -18,6 +25,35 @@ except ModuleNotFoundError:
     # not on an e-ink system; later factory check will load the right class
     pass
 
+# one shared formatter, so the locale is only looked up once
+_FORMATTER = DateTimeFormatter('en_us')
+
+# calendar grid cells by day of the month, with a blank cell at 0
+DAY_STR = [f'{i:2d}' if i else '  ' for i in range(32)]
+
+# days before the start of each month (and after the last one), in a common year
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181,
+                      212, 243, 273, 304, 334, 365)
+
+# text sprites used by this run, and ones left over from an earlier run,
+#  keyed by font path, font size, text, and anchor
+_SPRITES = {}
+_SAVED_SPRITES = {}
+
+
+def write_atomic(filename: str, data: bytes):
+    """
+    Write data to a file, replacing any previous contents in one step
+
+    Args:
+        filename (str): file to write
+        data (bytes): new contents of the file
+    """
+    temp = filename + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, filename)
+
 
 class RunningAverage():
     """Track the running average of a value
@@ -25,13 +61,16 @@ class RunningAverage():
     Credit to Dima Lituiev for https://stackoverflow.com/a/62768606
     """
 
+    # saved as the average and the count, little-endian
+    _FORMAT = struct.Struct('<dI')
+
     def __init__(self):
         self.average = 0
         self.n = 0
 
     def __call__(self, new_value):
         self.n += 1
-        self.average = (self.average * (self.n-1) + new_value) / self.n
+        self.average += (new_value - self.average) / self.n
 
     def __float__(self):
         return self.average
@@ -39,6 +78,135 @@ class RunningAverage():
     def __repr__(self):
         return "average: " + str(self.average)
 
+    @classmethod
+    def load(cls, filename):
+        """Load a saved running average, or start a new one if there is none."""
+        running = cls()
+        try:
+            with open(filename, 'rb') as f:
+                running.average, running.n = cls._FORMAT.unpack(f.read())
+        except (FileNotFoundError, struct.error):
+            pass
+        return running
+
+    def save(self, filename):
+        """Save the running average, replacing the file in one step."""
+        write_atomic(filename, self._FORMAT.pack(self.average, self.n))
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(font: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, reusing an already-loaded copy where possible
+
+    Args:
+        font (str): filename or path of the font to load
+        size (int): requested size, in points
+
+    Returns:
+        ImageFont.FreeTypeFont: the loaded font
+    """
+    return ImageFont.truetype(font=font, size=size)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_datetime(dt: datetime, tzinfo, fmt: str) -> str:
+    # tzinfo is part of the cache key because aware datetimes compare equal
+    #  across timezones, while their formatted strings do not
+    return _FORMATTER.format(dt, fmt)
+
+
+def format_date(date: arrow, fmt: str) -> str:
+    """
+    Format the given date, reusing earlier results for the same date and format
+
+    Args:
+        date (arrow): date to format
+        fmt (str): arrow format string
+
+    Returns:
+        str: formatted date
+    """
+    return _format_datetime(date.datetime, date.tzinfo, fmt)
+
+
+@functools.lru_cache(maxsize=256)
+def text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple:
+    """
+    Get the size of the given text, reusing earlier layouts of the same text and font
+
+    Args:
+        text (str): single line of text to measure
+        font (ImageFont.FreeTypeFont): font the text will be drawn in
+
+    Returns:
+        tuple: width and height of the text, as ImageDraw.textsize would report
+    """
+    return font.getbbox(text)[2:]
+
+
+def render_sprite(text: str, font: ImageFont.FreeTypeFont, anchor: str = 'la') -> tuple:
+    """
+    Rasterize the given text once into a tightly-cropped 1-bit mask
+
+    Args:
+        text (str): single line of text to rasterize
+        font (ImageFont.FreeTypeFont): font to draw the text in
+        anchor (str): Pillow text anchor the sprite will be positioned by
+
+    Returns:
+        tuple: the '1' mode mask, and its offset from the anchor point
+    """
+    key = (font.path, font.size, text, anchor)
+    if key in _SPRITES:
+        return _SPRITES[key]
+    if key in _SAVED_SPRITES:
+        _SPRITES[key] = _SAVED_SPRITES.pop(key)
+        return _SPRITES[key]
+
+    left, top, right, bottom = font.getbbox(text, anchor=anchor)
+    sprite = Image.new('L', (right-left, bottom-top), 0)
+    ImageDraw.Draw(sprite).text((-left, -top), text,
+                                font=font, fill=255, anchor=anchor)
+    # render antialiased and threshold afterwards, which inks the same pixels
+    #  as drawing antialiased text onto white and thresholding the result
+    _SPRITES[key] = sprite.convert(mode='1', dither=Image.NONE), (left, top)
+    return _SPRITES[key]
+
+
+def load_sprites(filename: str):
+    """
+    Load the text sprites saved by an earlier run, so they need not be rasterized again
+
+    Args:
+        filename (str): file written by save_sprites
+    """
+    try:
+        with open(filename, 'rb') as f:
+            saved = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return
+    for key, (size, offset, data) in saved.items():
+        _SAVED_SPRITES[key] = Image.frombytes('1', size, data), offset
+
+
+def save_sprites(filename: str):
+    """
+    Save the text sprites used by this run, replacing the file in one step
+
+    Only this run's sprites are kept, so the file does not grow with every
+    minute's time string.
+
+    Args:
+        filename (str): file to save to
+    """
+    # empty sprites (e.g. for glyphs missing from the font) cannot be rebuilt
+    #  by Image.frombytes, and are cheap to rasterize again anyway
+    saved = {key: (sprite.size, offset, sprite.tobytes())
+             for key, (sprite, offset) in _SPRITES.items() if all(sprite.size)}
+    write_atomic(filename, pickle.dumps(
+        saved, protocol=pickle.HIGHEST_PROTOCOL))
+
 
 def iso_week_num(date: arrow) -> int:
     """
@@ -50,8 +218,101 @@ def iso_week_num(date: arrow) -> int:
     Returns:
         int: ISO week number for date
     """
-    _, week, _ = date.format('W').split('-')
-    return int(week[1:])
+    return date.isocalendar()[1]
+
+
+def iso_weekday(year: int, month: int, day: int) -> int:
+    """
+    Returns the ISO weekday of the given date, by Zeller's congruence
+
+    Args:
+        year (int): Gregorian year
+        month (int): month, from 1
+        day (int): day of the month, from 1
+
+    Returns:
+        int: ISO weekday, 1 for Monday through 7 for Sunday
+    """
+    # Zeller counts January and February as months 13 and 14 of the year before
+    if month < 3:
+        month += 12
+        year -= 1
+    century, year_of_century = divmod(year, 100)
+    h = (day + 13*(month+1)//5 + year_of_century + year_of_century//4
+         + century//4 + 5*century) % 7
+    # h counts from Saturday as 0
+    return (h + 5) % 7 + 1
+
+
+def iso_weeks_in_year(year: int) -> int:
+    """
+    Returns the number of weeks in the given ISO year
+
+    Args:
+        year (int): ISO year
+
+    Returns:
+        int: 53 if the year starts on a Thursday (or a Wednesday, in a leap year), otherwise 52
+    """
+    first_weekday = iso_weekday(year, 1, 1)
+    if first_weekday == 4 or (first_weekday == 3 and calendar.isleap(year)):
+        return 53
+    return 52
+
+
+def iso_calendar(year: int, month: int, day: int) -> tuple:
+    """
+    Returns the ISO year, week number, and weekday of the given date
+
+    Equivalent to date.isocalendar(), but with integer arithmetic only.
+
+    Args:
+        year (int): Gregorian year
+        month (int): month, from 1
+        day (int): day of the month, from 1
+
+    Returns:
+        tuple: ISO year, ISO week number, and ISO weekday
+    """
+    weekday = iso_weekday(year, month, day)
+    day_of_year = _DAYS_BEFORE_MONTH[month-1] + day + \
+        (month > 2 and calendar.isleap(year))
+    week = (day_of_year - weekday + 10) // 7
+    if week < 1:
+        year -= 1
+        week = iso_weeks_in_year(year)
+    elif week > iso_weeks_in_year(year):
+        year += 1
+        week = 1
+    return year, week, weekday
+
+
+def month_grid(days: int, first_weekday: int, first_week: int, weeks_in_year: int) -> dict:
+    """
+    Lay out the days of a month into ISO weeks, using only integer arithmetic
+
+    Args:
+        days (int): number of days in the month
+        first_weekday (int): ISO weekday of the first day of the month
+        first_week (int): ISO week number of the first day of the month
+        weeks_in_year (int): number of weeks in the ISO year of the first day
+
+    Returns:
+        dict: keys of ISO weeknumbers, with values of day numbers from Monday to Sunday (0 where blank)
+    """
+    month_d = {}
+    weeknum = first_week
+    week = [0]*7
+    column = first_weekday - 1
+    for day in range(1, days+1):
+        week[column] = day
+        column += 1
+        if column == 7 or day == days:
+            month_d[weeknum] = week
+            weeknum = weeknum % weeks_in_year + 1
+            week = [0]*7
+            column = 0
+    return month_d
 
 
 def render_month(month: arrow):
@@ -62,17 +323,13 @@ def render_month(month: arrow):
         month (arrow): first day of month to format
 
     Returns:
-        dict: keys of ISO weeknumbers, keys of abbreviated day names, with values of arrow days
+        dict: keys of ISO weeknumbers, with values of day numbers from Monday to Sunday (0 where blank)
     """
-    month_d = {}
-    for day in arrow.Arrow.range('day', month, month.shift(months=+1)):
-        if day.month != month.month:
-            continue
-        weeknum = iso_week_num(day)
-        if weeknum not in month_d:
-            month_d[weeknum] = ['']*7
-        month_d[weeknum][day.isoweekday()-1] = day
-    return month_d
+    iso_year, first_week, first_weekday = iso_calendar(
+        month.year, month.month, 1)
+    days = _DAYS_BEFORE_MONTH[month.month] - _DAYS_BEFORE_MONTH[month.month-1] + \
+        (month.month == 2 and calendar.isleap(month.year))
+    return month_grid(days, first_weekday, first_week, iso_weeks_in_year(iso_year))
 
 
 class Clock():
@@ -88,6 +345,10 @@ class Clock():
 
         self.logger = logging.getLogger('eink_clock')
 
+        # Pillow-SIMD releases are tagged as post-releases of the matching Pillow
+        simd = ' (SIMD)' if '.post' in PIL.__version__ else ''
+        self.logger.debug(f'Using Pillow {PIL.__version__}{simd}')
+
         # get local timezone information
         self.tzinfo = datetime.now().astimezone().tzinfo
 
@@ -107,15 +368,17 @@ class Clock():
             self.width = self.height
             self.height = temp
 
-        self.large_font = ImageFont.truetype(font=config.get(
-            'font', 'large_font'), size=config.getint('font', 'large_size'))
-        self.small_font = ImageFont.truetype(font=config.get(
-            'font', 'small_font'), size=config.getint('font', 'small_size'))
-        self.tiny_font = ImageFont.truetype(font=config.get(
-            'font', 'tiny_font'), size=config.getint('font', 'tiny_size'))
+        self.large_font = load_font(config.get(
+            'font', 'large_font'), config.getint('font', 'large_size'))
+        self.small_font = load_font(config.get(
+            'font', 'small_font'), config.getint('font', 'small_size'))
+        self.tiny_font = load_font(config.get(
+            'font', 'tiny_font'), config.getint('font', 'tiny_size'))
 
-        self.canvas = Image.new('RGB', (self.width, self.height), 'WHITE')
-        self.draw = ImageDraw.Draw(self.canvas)
+        # one 1-bit plane per ink, as the display draws "black" or red on white
+        self.black = Image.new('1', (self.width, self.height), 'WHITE')
+        self.red = Image.new('1', (self.width, self.height), 'WHITE')
+        self.red_draw = ImageDraw.Draw(self.red)
 
     def draw_time(self):
         """Generate the time display."""
@@ -125,30 +388,30 @@ class Clock():
         self.logger.debug('drawing...')
 
         # draw the day name in top dead center
-        day = time.format('dddd')
-        _, h = self.draw.textsize(day, font=self.large_font)
-        self.draw.text((self.width/2, 0), day, font=self.large_font,
-                       fill='RED', anchor='ma')
+        day = format_date(time, 'dddd')
+        _, h = text_size(day, font=self.large_font)
+        self.paste_text((self.width/2, 0), day, font=self.large_font,
+                        plane=self.red, anchor='ma')
 
         # draw the date to the right and below
-        self.draw.text((self.width, h), time.format('MMMM Do, YYYY'), font=self.small_font,
-                       fill='BLUE', anchor='ra')
+        self.paste_text((self.width, h), format_date(time, 'MMMM Do, YYYY'), font=self.small_font,
+                        plane=self.black, anchor='ra')
 
         # draw the time to the left and below
         #  with the first digit highlighted in red and the rest in black
         hour_tens = f'{time.hour // 10}'
         time_rem = f'{time.hour % 10}:{time.minute:02d}'
-        w, _ = self.draw.textsize(hour_tens, font=self.large_font)
-        self.draw.text((0, h), hour_tens,
-                       font=self.large_font, fill='RED', anchor='la')
-        self.draw.text((w, h), time_rem,
-                       font=self.large_font, fill='BLUE', anchor='la')
+        w, _ = text_size(hour_tens, font=self.large_font)
+        self.paste_text((0, h), hour_tens,
+                        font=self.large_font, plane=self.red, anchor='la')
+        self.paste_text((w, h), time_rem,
+                        font=self.large_font, plane=self.black, anchor='la')
 
         # draw a reminder to erase the display at the specified offset
         erase_date = time.dehumanize(self.erase_offset)
-        erase_info = f'{time.format("YYYY-MM-DD")} erase by {erase_date.format("YYYY-MM-DD")}'
-        self.draw.text((self.width/2, self.height),
-                       erase_info, font=self.small_font, fill='BLUE', anchor='md')
+        erase_info = f'{format_date(time, "YYYY-MM-DD")} erase by {format_date(erase_date, "YYYY-MM-DD")}'
+        self.paste_text((self.width/2, self.height),
+                        erase_info, font=self.small_font, plane=self.black, anchor='md')
 
     def draw_calendar(self):
         """Generate the calendar display."""
@@ -160,12 +423,24 @@ class Clock():
         LINE_WIDTH = 2
 
         # four-month view: last month, this month, and next two
-        months = [
-            today.shift(months=-1).replace(day=1),
-            today.replace(day=1),
-            today.shift(months=+1).replace(day=1),
-            today.shift(months=+2).replace(day=1),
-        ]
+        #  counting in whole months, rather than shifting and replacing dates
+        months = []
+        for offset in (-1, 0, +1, +2):
+            year, month = divmod(today.year*12 + today.month-1 + offset, 12)
+            months.append(arrow.Arrow(year, month+1, 1, tzinfo=self.tzinfo))
+
+        # the day names are the same for every month, so lay them out once
+        header = ('#\t\t'+calendar.weekheader(2).replace(' ', '\t')
+                  ).expandtabs(TABSIZE)
+        header_w, header_h = text_size(header, font=self.tiny_font)
+        w = (self.width+header_w)/2
+
+        # the grid is in a monospace font, one tab stop per column:
+        #  week number, a blank column, then the seven days
+        column_start = w - header_w
+        col_w, _ = text_size(' '*TABSIZE, font=self.tiny_font)
+        cell_w, row_h = text_size('00', font=self.tiny_font)
+        star_w, _ = text_size('★', font=self.tiny_font)
 
         self.logger.debug('drawing...')
         top = 0
@@ -173,60 +448,67 @@ class Clock():
             month_d = render_month(month)
 
             # draw month header
-            month_header = month.format('MMMM YYYY')
-            self.draw.text((self.width/2, top), month_header,
-                           font=self.tiny_font, fill='RED', anchor='ma')
-            _, h = self.draw.textsize(month_header, font=self.tiny_font)
+            month_header = format_date(month, 'MMMM YYYY')
+            self.paste_text((self.width/2, top), month_header,
+                            font=self.tiny_font, plane=self.red, anchor='ma')
+            _, h = text_size(month_header, font=self.tiny_font)
             top += h + 10
 
             # draw day names
-            header = ('#\t\t'+calendar.weekheader(2).replace(' ', '\t')
-                      ).expandtabs(TABSIZE)
-            w, h = self.draw.textsize(header, font=self.tiny_font)
-            w = (self.width+w)/2
-            self.draw.text((w, top), header, font=self.tiny_font,
-                           fill='RED', anchor='ra')
-            top += h + 10
+            self.paste_text((w, top), header, font=self.tiny_font,
+                            plane=self.red, anchor='ra')
+            top += header_h + 10
 
-            # for each week, draw it out with padding
+            # for each week, draw each day into its column
             for weeknum, week in month_d.items():
-                week_str = []
-                for day in week:
+                self.paste_text((column_start, top), str(weeknum),
+                                font=self.tiny_font, plane=self.black)
+                for i, day in enumerate(week, start=2):
                     if day:
-                        week_str.append(f'{day.day:2d}')
-                    else:
-                        week_str.append(' '*2)
-                week_str = ('\t'.join(week_str))
-
-                week_str = f'{weeknum}\t\t{week_str}'.expandtabs(TABSIZE)
-                self.draw.text((w, top), week_str,
-                               font=self.tiny_font, fill='BLUE', anchor='ra')
-                ww, h = self.draw.textsize(week_str, font=self.tiny_font)
+                        self.paste_text((column_start + i*col_w, top), DAY_STR[day],
+                                        font=self.tiny_font, plane=self.black)
 
                 # draw a symbol next to the week number if it is this week
                 if iso_week_num(today) == weeknum and month.month == today.month:
-                    www, _ = self.draw.textsize('★', font=self.tiny_font)
-                    column_start = w-ww
-                    self.draw.text((column_start-www, top), '★',
-                                   font=self.tiny_font, fill='RED', anchor='ra')
+                    self.paste_text((column_start-star_w, top), '★',
+                                    font=self.tiny_font, plane=self.red, anchor='ra')
 
                     # also draw a box around today
-                    offset, _ = self.draw.textsize(
-                        ('  \t\t' + '\t'.join(['  ']*(today.isoweekday()))).expandtabs(TABSIZE), font=self.tiny_font)
-                    width, height = self.draw.textsize(
+                    offset = (today.isoweekday() + 1)*col_w + cell_w
+                    width, height = text_size(
                         str(today.day), font=self.tiny_font)
-                    
+
                     # figure out location
                     x0 = column_start + offset - width - GAP
                     x1 = column_start + offset + GAP
                     y0 = top - GAP/2
                     y1 = top + height + GAP*3/2
-                    self.draw.rounded_rectangle(
-                        ((x0, y0), (x1, y1)), outline='RED', width=LINE_WIDTH, radius=GAP)
+                    self.red_draw.rounded_rectangle(
+                        ((x0, y0), (x1, y1)), outline=0, width=LINE_WIDTH, radius=GAP)
 
-                top += h + 10
+                top += row_h + 10
             top += 20
 
+    def paste_text(self, xy, text, font, plane, anchor='la'):
+        """Ink text onto one of the planes from the sprite cache.
+
+        Takes the same arguments as ImageDraw.text, except that the ink
+        plane to draw on replaces the fill colour, and positions are
+        rounded to whole pixels so the rasterized sprite can be reused.
+        """
+        sprite, (left, top) = render_sprite(text, font, anchor)
+        x, y = xy
+        plane.paste(0, (round(x)+left, round(y)+top), mask=sprite)
+
+    def render(self):
+        """Combine the ink planes into a single RGB image."""
+        image = Image.new('RGB', (self.width, self.height), 'WHITE')
+        image = Image.composite(image, Image.new(
+            'RGB', image.size, 'BLUE'), self.black)
+        image = Image.composite(image, Image.new(
+            'RGB', image.size, 'RED'), self.red)
+        return image
+
     def display(self):
         """Display the canvas to user."""
         pass
@@ -246,14 +528,19 @@ class EPD_Clock(Clock):
         self.portrait = portrait
         self.epd = epd12in48b.EPD()
         self.epd.Init()
+        # hash of the frame last sent to the display, so an identical one can be skipped
+        self.last_frame = None
         if clear:
             self.logger.info('Clearing display')
             self.epd.clear()
+        else:
+            try:
+                with open('frame.dat', 'rb') as f:
+                    self.last_frame = f.read()
+            except FileNotFoundError:
+                pass
 
-        try:
-            self.update_avg = pickle.load(open('update.pkl', 'rb'))
-        except FileNotFoundError:
-            self.update_avg = RunningAverage()
+        self.update_avg = RunningAverage.load('update.dat')
 
         super().__init__(config=config, size=(
             epd12in48b.EPD_WIDTH, epd12in48b.EPD_HEIGHT), portrait=portrait)
@@ -262,31 +549,41 @@ class EPD_Clock(Clock):
         """Send the canvas to the display and then sleep."""
         super().display()
 
-        rotate = 180
+        rotate = Image.ROTATE_180
         if self.portrait:
-            rotate = 270
-
-        # use the RED channel as the red image
-        #  but convert it to 1-bit as the display draws "black" on white
-        #  and rotate it to match display orientation
-        redimage = self.canvas.getchannel(
-            channel='R').convert(mode='1', dither=Image.NONE).rotate(rotate, expand=True)
-
-        # use the BLUE channel as the black image
-        #  but convert it to 1-bit as the display draws "black" on white
-        #  and rotate it to match display orientation
-        blackimage = self.canvas.getchannel(
-            channel='B').convert(mode='1', dither=Image.NONE).rotate(rotate, expand=True)
+            rotate = Image.ROTATE_270
+
+        # nothing visible has changed if the same planes would be sent the same way
+        frame = hashlib.blake2b(bytes([rotate]), digest_size=16)
+        frame.update(self.black.tobytes())
+        frame.update(self.red.tobytes())
+        frame = frame.digest()
+        if frame == self.last_frame:
+            self.logger.info('Frame unchanged, skipping display')
+            self.epd.EPD_Sleep()
+            return
+
+        # the planes are already 1-bit as the display expects,
+        #  so only rotate them to match display orientation
+        #  (side by side if there are cores to spare, as transpose releases the GIL)
+        planes = (self.black, self.red)
+        if (os.cpu_count() or 1) > 1:
+            with ThreadPoolExecutor(max_workers=len(planes)) as executor:
+                blackimage, redimage = executor.map(
+                    lambda plane: plane.transpose(rotate), planes)
+        else:
+            blackimage, redimage = (plane.transpose(rotate) for plane in planes)
         self.logger.debug('Starting display')
         start = arrow.now(self.tzinfo)
-        self.epd.display(redimage, blackimage)
+        self.epd.display(blackimage, redimage)
         elapsed = (arrow.now(self.tzinfo) - start).total_seconds()
         self.update_avg(elapsed)
         self.logger.debug(
             f'Finished display in {elapsed:.3f}s (average {float(self.update_avg):.3f}s), starting sleep')
         self.epd.EPD_Sleep()
         self.logger.debug('Finished sleep')
-        pickle.dump(self.update_avg, open('update.pkl', 'wb'))
+        self.update_avg.save('update.dat')
+        write_atomic('frame.dat', frame)
 
 
 class PIL_Clock(Clock):
@@ -302,26 +599,21 @@ class PIL_Clock(Clock):
     def display(self):
         """Show the canvas to the user."""
         super().display()
-        image = self.canvas.rotate(180)
+        image = self.render().transpose(Image.ROTATE_180)
         image.show()
         return
         # also demonstrate the EPD images:
-        # use the RED channel as the red image
-        #  but convert it to 1-bit as the display draws "black" on white
-        #  and rotate it to match display orientation
-        redimage = self.canvas.getchannel(
-            channel='R').convert(mode='1', dither=Image.NONE).rotate(180)
-        redimage.show()
-
-        # use the BLUE channel as the black image
-        #  but convert it to 1-bit as the display draws "black" on white
-        #  and rotate it to match display orientation
-        blackimage = self.canvas.getchannel(
-            channel='B').convert(mode='1', dither=Image.NONE).rotate(180)
+        #  rotated to match display orientation
+        blackimage = self.black.transpose(Image.ROTATE_180)
         blackimage.show()
 
+        redimage = self.red.transpose(Image.ROTATE_180)
+        redimage.show()
+
 
+@functools.lru_cache(maxsize=None)
 def get_config():
+    """Read config.ini once, sharing the parsed config with later callers."""
     import configparser
     config = configparser.ConfigParser()
     config.read('config.ini')
@@ -335,6 +627,7 @@ if __name__ == '__main__':
     logger = logging.getLogger('eink_clock')
     logger.info('Starting!')
 
+    load_sprites('clock_sprites.pkl')
     if 'epd12in48b' in sys.modules:
         eink = EPD_Clock(config)
     else:
@@ -343,3 +636,4 @@ if __name__ == '__main__':
         eink = PIL_Clock(config)
     eink.draw_time()
     eink.display()
+    save_sprites('clock_sprites.pkl')